@@ -60,6 +60,16 @@ export interface ConverseParams {
   inferenceConfig?: ConverseInferenceConfig;
 }
 
+// Errors worth retrying, split by how the SDK or fetch path reports them
+const RETRIABLE_ERROR_NAMES = new Set([
+  'ThrottlingException',
+  'ServiceUnavailableException',
+  'InternalServerException',
+  'TimeoutError'
+]);
+
+const RETRIABLE_HTTP_STATUSES = new Set([500, 502, 503, 504]);
+
 export class BedrockClientError extends Error {
   constructor(
     message: string,
@@ -376,29 +386,20 @@ export class BedrockClient {
    * Check if error is retriable
    */
   private isRetriableError(error: any): boolean {
-    const errorCode = error.name || error.$metadata?.httpStatusCode;
     let httpStatus: number | undefined = error.$metadata?.httpStatusCode;
     if (!httpStatus && typeof error.code === 'string' && /^\d+$/.test(error.code)) {
       httpStatus = parseInt(error.code, 10);
     }
-    
+
     // Retry on throttling, temporary failures, and network issues
-    const retriableCodes = [
-      'ThrottlingException',
-      'ServiceUnavailableException',
-      'InternalServerException',
-      'TimeoutError',
-      500, 502, 503, 504
-    ];
-
-    if (httpStatus && (retriableCodes as any[]).includes(httpStatus)) {
+    if (httpStatus && RETRIABLE_HTTP_STATUSES.has(httpStatus)) {
       return true;
     }
 
     const msg = String(error?.message || '').toLowerCase();
     const code = String(error?.code || '').toUpperCase();
 
-    return retriableCodes.includes(errorCode) ||
+    return RETRIABLE_ERROR_NAMES.has(error.name) ||
            msg.includes('timeout') ||
            msg.includes('network') ||
            msg.includes('failed to fetch') ||